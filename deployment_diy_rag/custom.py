@@ -17,6 +17,7 @@ import json
 import os
 import sys
 import traceback
+from collections import defaultdict
 
 import pandas as pd
 import yaml
@@ -123,7 +124,7 @@ def score(data: pd.DataFrame, model: tuple[Runnable, RAGModelSettings], **kwargs
 
     chain, model_settings = model
 
-    full_result_dict: dict[str, list] = {TARGET_COLUMN_NAME: []}
+    full_result_dict: dict[str, list] = defaultdict(list)
 
     for i, row in data.iterrows():
         question = row[PROMPT_COLUMN_NAME]
@@ -149,12 +150,6 @@ def score(data: pd.DataFrame, model: tuple[Runnable, RAGModelSettings], **kwargs
                 )
             full_result_dict[TARGET_COLUMN_NAME].append(chain_output["answer"])
             for i, doc in enumerate(chain_output["context"]):
-                if f"CITATION_CONTENT_{i}" not in full_result_dict:
-                    full_result_dict[f"CITATION_CONTENT_{i}"] = []
-                if f"CITATION_SOURCE_{i}" not in full_result_dict:
-                    full_result_dict[f"CITATION_SOURCE_{i}"] = []
-                if f"CITATION_PAGE_{i}" not in full_result_dict:
-                    full_result_dict[f"CITATION_PAGE_{i}"] = []
                 full_result_dict[f"CITATION_CONTENT_{i}"].append(doc.page_content)
                 full_result_dict[f"CITATION_SOURCE_{i}"].append(
                     doc.metadata.get("source", "")
@@ -22,19 +22,21 @@ from datarobot_drum import RuntimeParameters
 def load_model(code_dir):
     blocklist = json.loads(RuntimeParameters.get("blocklist"))
     prompt_feature_name = RuntimeParameters.get("prompt_feature_name")
-    regex = "({})".format("|".join([keyword for keyword in blocklist]))
+    regex = re.compile("(?:{})".format("|".join(blocklist)), re.IGNORECASE)
     return regex, prompt_feature_name
 
 
 def score(data, model, **kwargs):
     regex, prompt_feature_name = model
 
-    output = []
     positive_label = kwargs["positive_class_label"]
     negative_label = kwargs["negative_class_label"]
-    for prompt in data[prompt_feature_name]:
-        block_input = bool(re.search(regex, prompt, re.IGNORECASE))
-        output.append(
-            {positive_label: float(block_input), negative_label: 1 - float(block_input)}
-        )
-    return pd.DataFrame(output)
+    # One vectorized pass over the prompt column instead of a Python-level
+    # regex call per row.
+    blocked = (
+        data[prompt_feature_name]
+        .str.contains(regex)
+        .fillna(False)
+        .to_numpy(dtype=float)
+    )
+    return pd.DataFrame({positive_label: blocked, negative_label: 1 - blocked})
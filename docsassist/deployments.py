@@ -39,6 +39,12 @@ class PulumiSettingsSource(EnvSettingsSource):
         super().__init__(*args, **kwargs)
 
     def read_pulumi_outputs(self) -> None:
+        # Stack outputs don't change within a process; skip the subprocess
+        # round trip once they have been read.
+        cls = PulumiSettingsSource
+        if cls._PULUMI_CALLED:
+            return
+        cls._PULUMI_CALLED = True
         try:
             raw_outputs = json.loads(
                 subprocess.check_output(
@@ -47,12 +53,12 @@ class PulumiSettingsSource(EnvSettingsSource):
                     stderr=subprocess.STDOUT,
                 ).strip()
             )
-            self._PULUMI_OUTPUTS = {
+            cls._PULUMI_OUTPUTS = {
                 k: v if isinstance(v, str) else json.dumps(v)
                 for k, v in raw_outputs.items()
             }
         except BaseException:
-            self._PULUMI_OUTPUTS = {}
+            cls._PULUMI_OUTPUTS = {}
 
     def _load_env_vars(self) -> Mapping[str, Union[str, None]]:
         return parse_env_vars(
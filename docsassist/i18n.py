@@ -17,6 +17,7 @@ from __future__ import annotations
 import gettext as gettext_module
 import os
 from enum import Enum
+from functools import lru_cache
 from gettext import GNUTranslations, NullTranslations
 from typing import Union
 
@@ -49,6 +50,14 @@ def compile_mo_from_po(locale_folder_path: str) -> None:
     if not os.path.exists(po_file_path):
         raise ValueError(f"Invalid locale file: {po_file_path}")
 
+    # The compiled catalog only changes when the .po source does; skip the
+    # parse/write round trip when base.mo is already up to date.
+    try:
+        if os.path.getmtime(mo_file_path) >= os.path.getmtime(po_file_path):
+            return
+    except OSError:
+        pass
+
     with open(po_file_path, "r", encoding="utf-8") as po_file:
         catalog = pofile.read_po(po_file)
     with open(mo_file_path, "wb") as mo_file:
@@ -84,15 +93,21 @@ class LocaleSettings(BaseSettings):
         return os.path.abspath(os.path.join(base_dir, "locale"))
 
 
+@lru_cache(maxsize=None)
 def get_translation_ctx() -> Union[NullTranslations, GNUTranslations]:
-    """Return a Translations instance based on the locale set in the environment"""
-    if LocaleSettings().app_locale == LanguageCode.EN:
+    """Return a Translations instance based on the locale set in the environment
+
+    The locale is fixed for the lifetime of the process, so the settings read
+    and catalog load happen once instead of on every gettext() call.
+    """
+    locale_settings = LocaleSettings()
+    if locale_settings.app_locale == LanguageCode.EN:
         return gettext_module.NullTranslations()
     else:
         return gettext_module.translation(
             "base",
-            localedir=LocaleSettings().get_locale_dir(),
-            languages=[LocaleSettings().app_locale],
+            localedir=locale_settings.get_locale_dir(),
+            languages=[locale_settings.app_locale],
             fallback=True,
         )
 
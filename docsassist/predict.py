@@ -14,10 +14,13 @@
 
 import json
 import logging
+import random
+import re
 import time
 import uuid
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from typing import Iterable, Tuple
 
 import datarobot as dr
@@ -53,34 +56,54 @@ class DeploymentInfo:
     target_name: str
 
 
+@lru_cache(maxsize=None)
 def _get_deployment_info(deployment_id: str) -> DeploymentInfo:
+    # Deployment metadata is immutable for a given id, so one API round trip
+    # per process is enough rather than one per completion.
     deployment = dr.Deployment.get(deployment_id)  # type: ignore[attr-defined]
     target_name = deployment.model["target_name"]  # type: ignore[index]
     return DeploymentInfo(deployment, str(target_name))
 
 
+_MAX_RETRY_DELAY_SECONDS = 30.0
+
+# Deployment prediction columns come back suffixed; compile the strip
+# pattern once instead of per completion.
+_PREDICTION_SUFFIX_RE = re.compile("_(PREDICTION|OUTPUT)$")
+
+
 def _predict_with_retry(
     deployment: Deployment,
     data_frame: pd.DataFrame,
     max_wait_seconds: int = 300,
-    retry_interval_seconds: int = 5,
+    retry_interval_seconds: int = 1,
 ) -> PredictionResult:
-    start_time = time.time()
+    """Call predict, backing off exponentially while the inference server starts.
+
+    The delay starts at `retry_interval_seconds`, doubles each attempt up to
+    a 30s cap, and is jittered so concurrent sessions don't retry in lockstep.
+    """
+    start_time = time.monotonic()
+    delay = float(retry_interval_seconds)
     while True:
         try:
             prediction = predict(deployment, data_frame=data_frame)
             return prediction
         except dr.errors.ServerError as e:
             if "Inference server is starting" in str(e):
-                elapsed_time = time.time() - start_time
+                elapsed_time = time.monotonic() - start_time
                 if elapsed_time > max_wait_seconds:
                     raise TimeoutError(
                         f"Server did not start within {max_wait_seconds} seconds"
                     )
+                sleep_seconds = min(delay, _MAX_RETRY_DELAY_SECONDS) * random.uniform(
+                    0.8, 1.2
+                )
                 logger.info(
-                    f"Server is starting. Retrying in {retry_interval_seconds} seconds..."
+                    f"Server is starting. Retrying in {sleep_seconds:.1f} seconds..."
                 )
-                time.sleep(retry_interval_seconds)
+                time.sleep(sleep_seconds)
+                delay *= 2
             else:
                 # If it's a different ServerError, re-raise it
                 raise
@@ -102,18 +125,23 @@ def get_rag_completion(
     ).model_dump(mode="json", by_alias=True)
     data["messages"] = json.dumps(data["messages"])
     rag_input = pd.DataFrame.from_records([data])
-    logging.info(
-        f"Rag Input: {json.dumps(rag_input.to_dict(orient='records'), indent=4)}"
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Rag Input: %s",
+            json.dumps(rag_input.to_dict(orient="records"), indent=4),
+        )
 
     rag_response_df = _predict_with_retry(
         rag_deployment, data_frame=rag_input
     ).dataframe
     rag_response_df.columns = rag_response_df.columns.str.replace(
-        "_(PREDICTION|OUTPUT)$", "", regex=True
+        _PREDICTION_SUFFIX_RE, "", regex=True
     )
+    # Normalize NaN to None at frame level so the per-value guard in
+    # parse_references hits its cheap `is None` branch.
+    rag_response_df = rag_response_df.where(rag_response_df.notna(), None)
     rag_response_dict = rag_response_df.to_dict(orient="records")[0]
-    rag_response_dict["__target"] = target_name
+    rag_response_dict["__target_name"] = target_name
 
     rag_output = RAGOutput.model_validate(rag_response_dict)
 
@@ -14,20 +14,26 @@
 
 from __future__ import annotations
 
-import math
 import re
+from collections import defaultdict
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple, Type
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type
 
-import pandas as pd
+# pandas is only needed by the DataFrame helpers; importing it lazily keeps
+# cold starts that just validate schemas from paying its import cost.
+# ChatCompletionMessageParam must stay a real import: pydantic resolves it
+# when building RAGInput's validator.
 from openai.types.chat.chat_completion_message_param import ChatCompletionMessageParam
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, model_validator
 from pydantic_settings import (
     BaseSettings,
     PydanticBaseSettingsSource,
     SettingsConfigDict,
 )
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class RAGType(str, Enum):
     DIY = "diy"
@@ -42,6 +48,34 @@ class ApplicationType(str, Enum):
 PROMPT_COLUMN_NAME: str = "promptText"
 TARGET_COLUMN_NAME: str = "resultText"
 
+_CITATION_RE = re.compile(r"CITATION_(\w+)_(\d+)")
+_PRED_SUFFIX = "_PREDICTION"
+
+
+def _set_citation_content(slot: Dict[str, Any], value: Any) -> None:
+    slot["page_content"] = value
+
+
+def _set_citation_source(slot: Dict[str, Any], value: Any) -> None:
+    slot.setdefault("metadata", {})["source"] = value
+
+
+def _set_citation_page(slot: Dict[str, Any], value: Any) -> None:
+    # Pages arrive as strings like "2.0"; go through float, then int so the
+    # stored value matches ReferenceMetadata.page on the model_construct path.
+    try:
+        value = int(float(value))
+    except Exception:
+        value = 0
+    slot.setdefault("metadata", {})["page"] = value
+
+
+_CITATION_DISPATCH = {
+    "CONTENT": _set_citation_content,
+    "SOURCE": _set_citation_source,
+    "PAGE": _set_citation_page,
+}
+
 
 class RAGInput(BaseModel):
     promptText: str = Field(serialization_alias=PROMPT_COLUMN_NAME)
@@ -59,6 +93,11 @@ class Reference(BaseModel):
     metadata: ReferenceMetadata
 
 
+# Instantiated once so reference lists validate in a single pydantic-core
+# call instead of one BaseModel construction per item.
+_REF_ADAPTER = TypeAdapter(List[Reference])
+
+
 class DocumentModel(BaseModel):
     page_content: str
     metadata: Dict[str, Any] = {}
@@ -89,66 +128,127 @@ class RAGOutput(BaseModel):
         if "references" in values:
             return values
 
-        references: List[Dict[str, Any]] = []
-        citation_pattern = re.compile(r"CITATION_(\w+)_(\d+)")
+        acc: Dict[int, Dict[str, Any]] = defaultdict(dict)
         target_name = values.pop("__target_name", None)
 
-        for key, value in values.items():
-            if isinstance(value, float) and math.isnan(value):
-                continue
-            match = citation_pattern.match(key)
-            if match:
-                citation_type, index = match.groups()
-                index = int(index)  # Convert to 0-based index
-
-                if len(references) <= index:
-                    references.extend([{} for _ in range(index - len(references) + 1)])
-
-                if citation_type == "CONTENT":
-                    references[index]["page_content"] = value
-                elif citation_type == "SOURCE":
-                    if "metadata" not in references[index]:
-                        references[index]["metadata"] = {}
-                    references[index]["metadata"]["source"] = value
-                elif citation_type == "PAGE":
-                    if "metadata" not in references[index]:
-                        references[index]["metadata"] = {}
-                    try:
-                        value = float(value)
-                    except Exception:
-                        value = 0
-                    references[index]["metadata"]["page"] = value
-
-        # Find the answer field
+        # Rows without citation columns (e.g. non-RAG deployments) skip the
+        # per-key regex scan entirely.
+        if any(isinstance(k, str) and k.startswith("CITATION_") for k in values):
+            for key, value in values.items():
+                # NaN is the only value unequal to itself; this avoids a
+                # math.isnan lookup and call per cell.
+                if value is None or (isinstance(value, float) and value != value):
+                    continue
+                match = _CITATION_RE.match(key)
+                if match:
+                    citation_type, index = match.groups()
+                    setter = _CITATION_DISPATCH.get(citation_type)
+                    if setter:
+                        setter(acc[int(index)], value)
+
+        references = [acc[i] for i in sorted(acc)]
+
+        # Find the answer field; callers that know the deployment's target
+        # pass __target_name so the full key scan only runs as a fallback.
         if target_name:
-            answer_field: str | None = f"{target_name}_PREDICTION"
+            answer_field: str | None = f"{target_name}{_PRED_SUFFIX}"
         else:
-            answer_field = next(
-                (k for k in values.keys() if k.endswith("_PREDICTION")), None
-            )
+            answer_field = None
+            for k in values:
+                if k.endswith(_PRED_SUFFIX):
+                    answer_field = k
+                    break
 
-        if answer_field:
+        if answer_field and answer_field in values:
             values["answer"] = values.pop(answer_field)
-        values["references"] = [Reference(**ref) for ref in references if ref]
+        values["references"] = _REF_ADAPTER.validate_python(
+            [ref for ref in references if ref]
+        )
         return values
 
+    @classmethod
+    def from_dataframe(
+        cls, df: pd.DataFrame, target_name: Optional[str] = None
+    ) -> List[RAGOutput]:
+        """Build one RAGOutput per row of a batch prediction frame.
+
+        Citation columns are classified once for the whole frame and read as
+        numpy arrays with a single `pd.isna` pass, so the per-row work is a
+        plain index into pre-extracted columns instead of a regex match and
+        NaN check on every key of every row.
+        """
+        import pandas as pd
+
+        citation_columns: List[Tuple[Any, int, Any, Any]] = []
+        for col in df.columns:
+            match = _CITATION_RE.match(col)
+            if match:
+                citation_type, index = match.groups()
+                setter = _CITATION_DISPATCH.get(citation_type)
+                if setter:
+                    arr = df[col].to_numpy()
+                    citation_columns.append((setter, int(index), arr, pd.isna(arr)))
+
+        n_slots = max((index for _, index, _, _ in citation_columns), default=-1) + 1
+
+        if target_name is not None and f"{target_name}{_PRED_SUFFIX}" in df.columns:
+            completion_col = f"{target_name}{_PRED_SUFFIX}"
+        elif TARGET_COLUMN_NAME in df.columns:
+            completion_col = TARGET_COLUMN_NAME
+        else:
+            completion_col = next(c for c in df.columns if c.endswith(_PRED_SUFFIX))
+        completions = df[completion_col].to_numpy()
+        questions = (
+            df[PROMPT_COLUMN_NAME].to_numpy()
+            if PROMPT_COLUMN_NAME in df.columns
+            else None
+        )
+
+        outputs: List[RAGOutput] = []
+        for pos in range(len(df)):
+            refs: List[Dict[str, Any]] = [{} for _ in range(n_slots)]
+            for setter, index, arr, isna in citation_columns:
+                if isna[pos]:
+                    continue
+                setter(refs[index], arr[pos])
+            # The reference dicts were assembled internally from regex-classified
+            # columns, so pydantic re-validation is skipped on this path.
+            row: Dict[str, Any] = {
+                TARGET_COLUMN_NAME: completions[pos],
+                "references": [
+                    Reference.model_construct(
+                        page_content=ref["page_content"],
+                        metadata=ReferenceMetadata.model_construct(
+                            **ref.get("metadata", {})
+                        ),
+                    )
+                    for ref in refs
+                    if ref
+                ],
+            }
+            if questions is not None:
+                row["question"] = questions[pos]
+            outputs.append(cls.model_validate(row))
+        return outputs
+
     def to_dataframe(self) -> pd.DataFrame:
-        input_data = {
-            "question": [self.question] if self.question else [""],
-            "answer": [self.completion],
+        import pandas as pd
+
+        record = {
+            "question": self.question or "",
+            "answer": self.completion,
         }
 
         for i, ref in enumerate(self.references, start=1):
-            input_data[f"context{i}"] = [ref.page_content]
-            input_data[f"source{i}"] = [ref.metadata.source]
+            record[f"context{i}"] = ref.page_content
+            record[f"source{i}"] = ref.metadata.source
             if ref.metadata.page:
-                input_data[f"page{i}"] = [str(ref.metadata.page)]
+                record[f"page{i}"] = str(ref.metadata.page)
 
         if self.usage:
-            for k, v in self.usage.items():
-                input_data[k] = [v]
+            record.update(self.usage)
 
-        return pd.DataFrame(input_data)
+        return pd.DataFrame.from_records([record])
 
 
 class CoreSettings(BaseSettings):
@@ -169,9 +269,8 @@ class CoreSettings(BaseSettings):
 
     model_config = SettingsConfigDict(env_prefix="MAIN_", case_sensitive=False)
 
-    @classmethod
+    @staticmethod
     def settings_customise_sources(
-        cls,
         settings_cls: Type[BaseSettings],
         init_settings: PydanticBaseSettingsSource,
         env_settings: PydanticBaseSettingsSource,
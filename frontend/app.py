@@ -44,6 +44,18 @@ logging.basicConfig(format="%(levelname)s:%(message)s", level=logging.INFO)
 DATAROBOT_ENDPOINT = os.getenv("DATAROBOT_ENDPOINT")
 DATAROBOT_API_KEY = os.getenv("DATAROBOT_API_TOKEN")
 
+# Static UI strings, resolved through the catalog once per rerun rather than
+# once per message or citation rendered.
+_MSG_USER = gettext("User")
+_MSG_ASSISTANT = gettext("Assistant")
+_MSG_CONVERSATION_HISTORY = gettext("Conversation History")
+_MSG_SHOW_CITATIONS = gettext("Show Citations")
+_MSG_REFERENCE = gettext("**Reference {0}:**")
+_MSG_SOURCE = gettext("**Source:** {0}")
+_MSG_CONTENT = gettext("**Content:**")
+_MSG_YOUR_MESSAGE = gettext("Your message")
+_MSG_GETTING_AI_RESPONSE = gettext("Getting AI response...")
+
 st.set_page_config(
     page_title=app_settings.page_title, page_icon="./datarobot_favicon.png"
 )
@@ -61,7 +73,19 @@ with open(logo) as f:
 
 st.markdown(f"<style>{css}</style>", unsafe_allow_html=True)
 
-dr.Client(endpoint=DATAROBOT_ENDPOINT, token=DATAROBOT_API_KEY)  # type: ignore[attr-defined]
+
+@st.cache_resource
+def _get_dr_client() -> dr.Client:  # type: ignore[name-defined]
+    """Create the DataRobot client once per process.
+
+    Streamlit re-executes this module on every interaction; caching keeps one
+    configured client (and its keep-alive HTTP session) across reruns instead
+    of re-resolving config each time.
+    """
+    return dr.Client(endpoint=DATAROBOT_ENDPOINT, token=DATAROBOT_API_KEY)  # type: ignore[attr-defined]
+
+
+_get_dr_client()
 
 
 if "messages" not in st.session_state:
@@ -82,7 +106,7 @@ def render_message(
     container: DeltaGenerator, message: str, is_user: bool = False
 ) -> None:
     message_role = "user" if is_user else "ai"
-    message_label = gettext("User") if is_user else gettext("Assistant")
+    message_label = _MSG_USER if is_user else _MSG_ASSISTANT
     container.markdown(
         f"""
     <div class="chat-message {message_role}-message">
@@ -97,7 +121,7 @@ def render_message(
 
 
 def render_conversation_history(container: DeltaGenerator) -> None:
-    container.subheader(gettext("Conversation History"))
+    container.subheader(_MSG_CONVERSATION_HISTORY)
     for message in st.session_state.messages[:-1]:  # Exclude the latest message
         render_message(container, message["content"], message["role"] == "user")
     st.markdown("---")
@@ -106,11 +130,11 @@ def render_conversation_history(container: DeltaGenerator) -> None:
 def render_answer_and_citations(container: DeltaGenerator, response: RAGOutput) -> None:
     render_message(container, response.completion, is_user=False)
 
-    with st.expander(gettext("Show Citations")):
+    with st.expander(_MSG_SHOW_CITATIONS):
         for i, doc in enumerate(response.references):
-            st.markdown(gettext("**Reference {0}:**").format(i + 1))
-            st.markdown(gettext("**Source:** {0}").format(doc.metadata.source))
-            st.markdown(gettext("**Content:**"))
+            st.markdown(_MSG_REFERENCE.format(i + 1))
+            st.markdown(_MSG_SOURCE.format(doc.metadata.source))
+            st.markdown(_MSG_CONTENT)
             for text in doc.page_content.split("\\n"):
                 if text.strip():
                     st.markdown(text)
@@ -129,7 +153,7 @@ def main() -> None:
     if "prompt_sent" not in st.session_state:
         st.session_state.prompt_sent = False
     prompt = chat_container.chat_input(
-        placeholder=gettext("Your message"),
+        placeholder=_MSG_YOUR_MESSAGE,
         key=None,
         max_chars=None,
         disabled=False,
@@ -141,7 +165,7 @@ def main() -> None:
     if prompt and prompt.strip():
         st.session_state.prompt_sent = True
 
-        with st.spinner(gettext("Getting AI response...")):
+        with st.spinner(_MSG_GETTING_AI_RESPONSE):
             response, association_id = predict.get_rag_completion(
                 question=prompt,
                 messages=st.session_state.messages,
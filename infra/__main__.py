@@ -37,18 +37,15 @@ from infra import (
 )
 from infra.common.feature_flags import check_feature_flags
 from infra.common.globals import GlobalLLM
-from infra.common.papermill import run_notebook
 from infra.common.urls import get_deployment_url
 from infra.components.custom_model_deployment import CustomModelDeployment
 from infra.components.dr_llm_credential import (
     get_credential_runtime_parameter_values,
     get_credentials,
 )
-from infra.components.proxy_llm_blueprint import ProxyLLMBlueprint
 from infra.settings_global_guardrails import llm_metrics
 
 # from infra.settings_global_guardrails import stay_on_topic_guardrail
-from infra.settings_proxy_llm import TEXTGEN_DEPLOYMENT_PROMPT_COLUMN_NAME
 
 DEPLOYMENT_ID = os.environ.get("TEXTGEN_DEPLOYMENT_ID")
 
@@ -58,7 +55,8 @@ if settings_generative.LLM == GlobalLLM.DEPLOYED_LLM:
             "TEXTGEN_DEPLOYMENT_ID must be set when using a deployed LLM. Plese check your .env file"
         )
 
-LocaleSettings().setup_locale()
+locale_settings = LocaleSettings()
+locale_settings.setup_locale()
 
 check_feature_flags(pathlib.Path("feature_flag_requirements.yaml"))
 
@@ -72,6 +70,9 @@ if "DATAROBOT_DEFAULT_USE_CASE" in os.environ:
 else:
     use_case = datarobot.UseCase(**settings_main.use_case_args)
 
+# Bind the output once; every consumer shares a single dependency edge.
+uc_id = use_case.id
+
 if settings_main.default_prediction_server_id is None:
     prediction_environment = datarobot.PredictionEnvironment(
         **settings_main.prediction_environment_args,
@@ -92,30 +93,35 @@ guard_configurations = llm_metrics
 
 if settings_main.core.rag_type == RAGType.DR:
     dataset = datarobot.DatasetFromFile(
-        use_case_ids=[use_case.id],
+        use_case_ids=[uc_id],
         **settings_generative.dataset_args.model_dump(),
     )
     vector_database = datarobot.VectorDatabase(
         dataset_id=dataset.id,
-        use_case_id=use_case.id,
+        use_case_id=uc_id,
         **settings_generative.vector_database_args.model_dump(),
     )
     playground = datarobot.Playground(
-        use_case_id=use_case.id,
+        use_case_id=uc_id,
         **settings_generative.playground_args.model_dump(),
     )
+    pg_id = playground.id
 
     if settings_generative.LLM == GlobalLLM.DEPLOYED_LLM:
+        from infra.components.proxy_llm_blueprint import ProxyLLMBlueprint
+        from infra.settings_proxy_llm import TEXTGEN_DEPLOYMENT_PROMPT_COLUMN_NAME
+
         assert DEPLOYMENT_ID is not None, "TEXTGEN_DEPLOYMENT_ID must be set in .env"
         proxy_llm_deployment = datarobot.Deployment.get(
             resource_name="Existing LLM Deployment", id=DEPLOYMENT_ID
         )
 
         llm_blueprint = ProxyLLMBlueprint(
-            resource_name=f"Proxy Model LLM Blueprint [{settings_main.project_name}]",
+            resource_name="Proxy Model LLM Blueprint"
+            + settings_main.project_name_suffix,
             llm_blueprint_args=settings_generative.llm_blueprint_args,
-            use_case_id=use_case.id,
-            playground_id=playground.id,
+            use_case_id=uc_id,
+            playground_id=pg_id,
             proxy_llm_deployment_id=proxy_llm_deployment.id,
             vector_database_id=vector_database.id,
             prompt_column_name=TEXTGEN_DEPLOYMENT_PROMPT_COLUMN_NAME,
@@ -123,14 +129,14 @@ if settings_main.core.rag_type == RAGType.DR:
 
     elif settings_generative.LLM.name != GlobalLLM.DEPLOYED_LLM.name:
         llm_blueprint = datarobot.LlmBlueprint(  # type: ignore[assignment]
-            playground_id=playground.id,
+            playground_id=pg_id,
             vector_database_id=vector_database.id,
             **settings_generative.llm_blueprint_args.model_dump(),
         )
 
     rag_custom_model = datarobot.CustomModel(
         **settings_generative.custom_model_args.model_dump(exclude_none=True),
-        use_case_ids=[use_case.id],
+        use_case_ids=[uc_id],
         source_llm_blueprint_id=llm_blueprint.id,
         guard_configurations=guard_configurations,
         runtime_parameter_values=[]
@@ -139,12 +145,13 @@ if settings_main.core.rag_type == RAGType.DR:
     )
 
 elif settings_main.core.rag_type == RAGType.DIY:
+    diy_rag_nb_output = settings_generative.diy_rag_nb_output
     if not all(
-        [
-            path.exists()
-            for path in settings_generative.diy_rag_nb_output.model_dump().values()
-        ]
+        getattr(diy_rag_nb_output, field).exists()
+        for field in diy_rag_nb_output.model_fields
     ):
+        from infra.common.papermill import run_notebook
+
         pulumi.info("Executing doc chunking + vdb building notebook...")
         run_notebook(settings_generative.diy_rag_nb)
     else:
@@ -158,7 +165,7 @@ elif settings_main.core.rag_type == RAGType.DIY:
         ),
         runtime_parameter_values=credential_runtime_parameter_values,
         guard_configurations=guard_configurations,
-        use_case_ids=[use_case.id],
+        use_case_ids=[uc_id],
         base_environment_id=settings_main.runtime_environment_moderations.id,
         **settings_generative.custom_model_args.model_dump(
             mode="json", exclude_none=True
@@ -168,12 +175,12 @@ else:
     raise NotImplementedError(f"Unknown RAG type: {settings_main.core.rag_type}")
 
 rag_deployment = CustomModelDeployment(
-    resource_name=f"Guarded RAG Deploy [{settings_main.project_name}]",
+    resource_name="Guarded RAG Deploy" + settings_main.project_name_suffix,
     custom_model_version_id=rag_custom_model.version_id,
     registered_model_args=settings_generative.registered_model_args,
     prediction_environment=prediction_environment,
     deployment_args=settings_generative.deployment_args,
-    use_case_ids=[use_case.id],
+    use_case_ids=[uc_id],
 )
 
 app_runtime_parameters = [
@@ -181,7 +188,7 @@ app_runtime_parameters = [
         key=rag_deployment_env_name, type="deployment", value=rag_deployment.id
     ),
     datarobot.ApplicationSourceRuntimeParameterValueArgs(
-        key="APP_LOCALE", type="string", value=LocaleSettings().app_locale
+        key="APP_LOCALE", type="string", value=locale_settings.app_locale
     ),
 ]
 
@@ -193,12 +200,12 @@ if settings_main.core.application_type == ApplicationType.DIY:
     qa_application = datarobot.CustomApplication(
         resource_name=settings_app_infra.app_resource_name,
         source_version_id=application_source.version_id,
-        use_case_ids=[use_case.id],
+        use_case_ids=[uc_id],
     )
 elif settings_main.core.application_type == ApplicationType.DR:
     qa_application = datarobot.QaApplication(  # type: ignore[assignment]
         resource_name=settings_app_infra.app_resource_name,
-        name=f"Guarded RAG Assistant [{settings_main.project_name}]",
+        name="Guarded RAG Assistant" + settings_main.project_name_suffix,
         deployment_id=rag_deployment.deployment_id,
         opts=pulumi.ResourceOptions(delete_before_replace=True),
     )
@@ -29,11 +29,45 @@ from docsassist.credentials import (
 )
 from infra.common.globals import GlobalLLM, LLMConfig
 
-from ..settings_main import project_name
+from ..settings_main import project_name_suffix
 
 # from .aws_credential import AWSCredential
 
 
+def _make_api_token_credential(
+    resource_name: str, value: Any
+) -> datarobot.ApiTokenCredential:
+    return datarobot.ApiTokenCredential(
+        resource_name=resource_name,
+        api_token=value,
+    )
+
+
+def _make_google_cloud_credential(
+    resource_name: str, value: Any
+) -> datarobot.GoogleCloudCredential:
+    return datarobot.GoogleCloudCredential(
+        resource_name=resource_name,
+        gcp_key=value.get("gcpKey"),
+    )
+
+
+def _make_aws_credential(resource_name: str, value: Any) -> datarobot.AwsCredential:
+    return datarobot.AwsCredential(
+        resource_name=resource_name,
+        aws_access_key_id=value["awsAccessKeyId"],
+        aws_secret_access_key=value["awsSecretAccessKey"],
+        aws_session_token=value.get("awsSessionToken"),
+    )
+
+
+_CREDENTIAL_FACTORIES = {
+    "credential": _make_api_token_credential,
+    "google_credential": _make_google_cloud_credential,
+    "aws_credential": _make_aws_credential,
+}
+
+
 def get_credential_runtime_parameter_values(
     credentials: DRCredentials | None,
 ) -> list[datarobot.CustomModelRuntimeParameterValueArgs]:
@@ -66,7 +100,6 @@ def get_credential_runtime_parameter_values(
                 "description": "Azure OpenAI API version",
             },
         ]
-        credential_rtp_dicts = [rtp for rtp in rtps if rtp["value"] is not None]
     elif isinstance(credentials, GoogleCredentials):
         rtps = [
             {
@@ -79,7 +112,6 @@ def get_credential_runtime_parameter_values(
             rtps.append(
                 {"key": "GOOGLE_REGION", "type": "string", "value": credentials.region}
             )
-        credential_rtp_dicts = [rtp for rtp in rtps if rtp["value"] is not None]
     elif isinstance(credentials, AWSBedrockCredentials):
         rtps = [
             {
@@ -101,42 +133,23 @@ def get_credential_runtime_parameter_values(
                 }
             )
 
-        credential_rtp_dicts = [rtp for rtp in rtps if rtp["value"] is not None]
+    credential_rtp_dicts = [rtp for rtp in rtps if rtp["value"] is not None]
 
     credential_runtime_parameter_values: list[
         datarobot.CustomModelRuntimeParameterValueArgs
     ] = []
 
     for rtp_dict in credential_rtp_dicts:
-        dr_credential: (
-            datarobot.ApiTokenCredential
-            | datarobot.GoogleCloudCredential
-            | datarobot.AwsCredential
-        )
-        if "credential" in rtp_dict["type"]:
-            if rtp_dict["type"] == "credential":
-                dr_credential = datarobot.ApiTokenCredential(
-                    resource_name=f"Guarded RAG {rtp_dict['key']} Credential [{project_name}]",
-                    api_token=rtp_dict["value"],
-                )
-            elif rtp_dict["type"] == "google_credential":
-                dr_credential = datarobot.GoogleCloudCredential(
-                    resource_name=f"Guarded RAG {rtp_dict['key']} Credential [{project_name}]",
-                    gcp_key=rtp_dict["value"].get("gcpKey"),
-                )
-            elif rtp_dict["type"] == "aws_credential":
-                dr_credential = datarobot.AwsCredential(
-                    resource_name=f"Guarded RAG {rtp_dict['key']} Credential [{project_name}]",
-                    aws_access_key_id=rtp_dict["value"]["awsAccessKeyId"],
-                    aws_secret_access_key=rtp_dict["value"]["awsSecretAccessKey"],
-                    aws_session_token=rtp_dict["value"].get("awsSessionToken"),
-                )
-
+        credential_factory = _CREDENTIAL_FACTORIES.get(rtp_dict["type"])
+        if credential_factory is not None:
+            dr_credential = credential_factory(
+                "Guarded RAG {} Credential".format(rtp_dict["key"])
+                + project_name_suffix,
+                rtp_dict["value"],
+            )
             rtp = datarobot.CustomModelRuntimeParameterValueArgs(
                 key=rtp_dict["key"],
-                type="credential"
-                if "credential" in rtp_dict["type"]
-                else rtp_dict["type"],
+                type="credential",
                 value=dr_credential.id,
             )
         else:
@@ -149,9 +162,25 @@ def get_credential_runtime_parameter_values(
     return credential_runtime_parameter_values
 
 
-# Initialize the LLM client based on the selected LLM and its credential type
+# Credentials already resolved in this process, keyed by LLM name. Resolution
+# parses the env and runs a live test completion, so it should happen once
+# even if several modules ask for the same LLM. LLMConfig is a pydantic model
+# and not hashable, so a plain dict stands in for lru_cache here.
+_credentials_cache: dict[tuple[str, bool], DRCredentials | None] = {}
+
+
 def get_credentials(
     llm: LLMConfig, test_credentials: bool = True
+) -> DRCredentials | None:
+    cache_key = (llm.name, test_credentials)
+    if cache_key not in _credentials_cache:
+        _credentials_cache[cache_key] = _resolve_credentials(llm, test_credentials)
+    return _credentials_cache[cache_key]
+
+
+# Initialize the LLM client based on the selected LLM and its credential type
+def _resolve_credentials(
+    llm: LLMConfig, test_credentials: bool = True
 ) -> DRCredentials | None:
     try:
         credentials: DRCredentials
@@ -19,6 +19,8 @@ from typing import Any, Optional, Union
 import datarobot as dr
 import pulumi
 import pulumi_datarobot as datarobot
+from datarobot import Deployment, Model  # type: ignore
+from datarobot.models.genai.custom_model_validation import CustomModelValidation
 from datarobotx.idp.custom_model_llm_validation import (
     get_update_or_create_custom_model_llm_validation,
 )
@@ -26,6 +28,65 @@ from datarobotx.idp.llm_blueprints import get_or_create_llm_blueprint
 
 from infra.common.schema import LLMBlueprintArgs
 
+# Patch the datarobot SDK exactly once at import time; the patches are
+# idempotent and must not be reapplied on every Pulumi apply callback.
+if getattr(CustomModelValidation, "_update", None) is None:
+    CustomModelValidation._update = CustomModelValidation.update  # type: ignore
+
+    def _update_without_extra_kwargs(
+        self: Any,
+        name: Optional[str] = None,
+        prompt_column_name: Optional[str] = None,
+        target_column_name: Optional[str] = None,
+        deployment: Optional[Union[Deployment, str]] = None,
+        model: Optional[Union[Model, str]] = None,
+        prediction_timeout: Optional[int] = None,
+        **kwargs: Any,
+    ) -> CustomModelValidation:
+        return CustomModelValidation._update(  # type: ignore
+            self,
+            name=name,
+            prompt_column_name=prompt_column_name,
+            target_column_name=target_column_name,
+            deployment=deployment,
+            model=model,
+            prediction_timeout=prediction_timeout,
+        )
+
+    CustomModelValidation.update = _update_without_extra_kwargs  # type: ignore
+
+if (
+    getattr(
+        dr.models.genai.custom_model_llm_validation.CustomModelLLMValidation,
+        "_list",
+        None,
+    )
+    is None
+):
+    dr.models.genai.custom_model_llm_validation.CustomModelLLMValidation._list = (  # type: ignore
+        dr.models.genai.custom_model_llm_validation.CustomModelLLMValidation.list
+    )
+
+    def _list_filtered_by_use_case(
+        *args: Any, **kwargs: Any
+    ) -> list[dr.models.genai.custom_model_llm_validation.CustomModelLLMValidation]:
+        return [
+            val
+            for val in dr.models.genai.custom_model_llm_validation.CustomModelLLMValidation._list(  # type: ignore
+                *args, **kwargs
+            )
+            if val.use_case_id == kwargs.get("use_case")
+        ]
+
+    dr.models.genai.custom_model_llm_validation.CustomModelLLMValidation.list = (  # type: ignore
+        _list_filtered_by_use_case  # type: ignore
+    )
+
+# Validation ids already resolved in this process, keyed by the inputs that
+# determine them. Avoids duplicate Deployment.get round trips when the Pulumi
+# output graph re-evaluates during a single up/preview.
+_validation_cache: dict[tuple[str, str, str | None], str] = {}
+
 
 class ProxyLLMBlueprint(pulumi.ComponentResource):
     @staticmethod
@@ -34,71 +95,29 @@ class ProxyLLMBlueprint(pulumi.ComponentResource):
         use_case_id: str,
         prompt_column_name: str | None = None,
     ) -> str:
+        cache_key = (proxy_llm_deployment_id, use_case_id, prompt_column_name)
+        if cache_key in _validation_cache:
+            return _validation_cache[cache_key]
+
         dr_client = dr.client.get_client()
         try:
             deployment = dr.Deployment.get(deployment_id=proxy_llm_deployment_id)  # type: ignore[attr-defined]
         except Exception as e:
             raise ValueError("Couldn't find deployment ID") from e
-        if deployment.model is None:
+        deployment_model = deployment.model
+        if deployment_model is None:
             raise ValueError("Deployment model is not set")
 
-        target_column_name = deployment.model["target_name"]
+        target_column_name = deployment_model["target_name"]
 
         if prompt_column_name is None:
-            if (
-                "prompt" not in deployment.model
-                or deployment.model.get("prompt") is None
-            ):
+            inferred_prompt = deployment_model.get("prompt")
+            if inferred_prompt is None:
                 pulumi.warn(
                     "Couldn't infer prompt column name of the textgen deployment. Using default 'promptText'."
                 )
-            prompt_column_name = str(deployment.model.get("prompt", "promptText"))
-
-        from datarobot.models.genai.custom_model_validation import CustomModelValidation  # noqa: I001
-        from datarobot import Deployment, Model  # type: ignore
-
-        CustomModelValidation._update = CustomModelValidation.update  # type: ignore
-
-        def new_update(
-            self: Any,
-            name: Optional[str] = None,
-            prompt_column_name: Optional[str] = None,
-            target_column_name: Optional[str] = None,
-            deployment: Optional[Union[Deployment, str]] = None,
-            model: Optional[Union[Model, str]] = None,
-            prediction_timeout: Optional[int] = None,
-            **kwargs: Any,
-        ) -> CustomModelValidation:
-            return CustomModelValidation._update(  # type: ignore
-                self,
-                name=name,
-                prompt_column_name=prompt_column_name,
-                target_column_name=target_column_name,
-                deployment=deployment,
-                model=model,
-                prediction_timeout=prediction_timeout,
-            )
-
-        CustomModelValidation.update = new_update  # type: ignore
-
-        dr.models.genai.custom_model_llm_validation.CustomModelLLMValidation._list = (  # type: ignore
-            dr.models.genai.custom_model_llm_validation.CustomModelLLMValidation.list
-        )
-
-        def new_list(
-            *args: Any, **kwargs: Any
-        ) -> list[dr.models.genai.custom_model_llm_validation.CustomModelLLMValidation]:
-            return [
-                val
-                for val in dr.models.genai.custom_model_llm_validation.CustomModelLLMValidation._list(  # type: ignore
-                    *args, **kwargs
-                )
-                if val.use_case_id == kwargs.get("use_case")
-            ]
-
-        dr.models.genai.custom_model_llm_validation.CustomModelLLMValidation.list = (  # type: ignore
-            new_list  # type: ignore
-        )
+                inferred_prompt = "promptText"
+            prompt_column_name = str(inferred_prompt)
 
         llm_validation_id = get_update_or_create_custom_model_llm_validation(
             endpoint=dr_client.endpoint,
@@ -108,7 +127,8 @@ class ProxyLLMBlueprint(pulumi.ComponentResource):
             target_column_name=target_column_name,
             use_case=use_case_id,
         )
-        return str(llm_validation_id)
+        _validation_cache[cache_key] = str(llm_validation_id)
+        return _validation_cache[cache_key]
 
     def __init__(
         self,
@@ -125,31 +145,21 @@ class ProxyLLMBlueprint(pulumi.ComponentResource):
             "custom:datarobot:ProxyLLMBlueprint", resource_name, None, opts
         )
 
-        self.llm_validation_id = pulumi.Output.all(
-            proxy_llm_deployment_id=proxy_llm_deployment_id, use_case_id=use_case_id
-        ).apply(
-            lambda kwargs: self._get_custom_model_llm_validation(
+        dr_client = dr.client.get_client()
+        old_settings = llm_blueprint_args
+
+        def _build(kwargs: dict[str, Any]) -> tuple[str, str]:
+            llm_validation_id = self._get_custom_model_llm_validation(
                 proxy_llm_deployment_id=kwargs["proxy_llm_deployment_id"],
                 use_case_id=kwargs["use_case_id"],
                 prompt_column_name=prompt_column_name,
             )
-        )
-        dr_client = dr.client.get_client()
-
-        old_settings = llm_blueprint_args
-        llm_blueprint_id = pulumi.Output.all(
-            llm_validation_id=self.llm_validation_id,
-            playground_id=playground_id,
-            vector_database_id=vector_database_id
-            if vector_database_id is not None
-            else None,
-        ).apply(
-            lambda kwargs: get_or_create_llm_blueprint(
+            llm_blueprint_id = get_or_create_llm_blueprint(
                 endpoint=dr_client.endpoint,
                 token=dr_client.token,
                 llm_settings=dr.models.genai.llm_blueprint.LLMSettingsCustomModelDict(
                     system_prompt=old_settings.llm_settings.system_prompt,
-                    validation_id=kwargs["llm_validation_id"],
+                    validation_id=llm_validation_id,
                 ),
                 llm="custom-model",
                 playground=kwargs["playground_id"],
@@ -157,7 +167,20 @@ class ProxyLLMBlueprint(pulumi.ComponentResource):
                 vector_database=kwargs["vector_database_id"],
                 vector_database_settings=old_settings.vector_database_settings.model_dump(),
             )
-        )
+            return llm_validation_id, str(llm_blueprint_id)
+
+        # One apply resolves all upstream outputs together and reuses the
+        # single dr client, instead of building two separate output graphs.
+        resolved = pulumi.Output.all(
+            proxy_llm_deployment_id=proxy_llm_deployment_id,
+            use_case_id=use_case_id,
+            playground_id=playground_id,
+            vector_database_id=vector_database_id
+            if vector_database_id is not None
+            else None,
+        ).apply(_build)
+        self.llm_validation_id = resolved.apply(lambda ids: ids[0])
+        llm_blueprint_id = resolved.apply(lambda ids: ids[1])
         self.llm_blueprint = datarobot.LlmBlueprint.get(
             id=llm_blueprint_id, resource_name="Custom Blueprint"
         )
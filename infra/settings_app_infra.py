@@ -12,16 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import datarobot as dr
+import os
+from typing import Iterator
+
 import pulumi
 
 from docsassist.i18n import LanguageCode, LocaleSettings
 from infra.common.globals import GlobalRuntimeEnvironment
 from infra.common.schema import ApplicationSourceArgs
-from infra.settings_main import PROJECT_ROOT, project_name
+from infra.settings_main import PROJECT_ROOT, project_name_suffix
 
 
 def ensure_app_settings(app_id: str) -> None:
+    # Deferred: the datarobot client is only needed in this post-deploy hook,
+    # not when the module is imported for its source file manifest.
+    import datarobot as dr
+
     try:
         dr.client.get_client().patch(
             f"customApplications/{app_id}/",
@@ -35,10 +41,26 @@ def ensure_app_settings(app_id: str) -> None:
 _application_path = PROJECT_ROOT / "frontend"
 
 
+def _walk_files(root: str) -> Iterator[str]:
+    """Yield all file paths under root using scandir.
+
+    scandir reports the entry type from the dirent, so this avoids the extra
+    stat call per path that glob + is_file() pays.
+    """
+    for entry in os.scandir(root):
+        if entry.is_dir(follow_symlinks=False):
+            yield from _walk_files(entry.path)
+        elif entry.is_file(follow_symlinks=False):
+            yield entry.path
+
+
+# Every walked path starts with the application dir plus a separator, so a
+# fixed-offset slice gives the relative path without relpath's per-call
+# normalization.
+_prefix_len = len(str(_application_path)) + 1
+
 source_files = [
-    (str(f), str(f.relative_to(_application_path)))
-    for f in _application_path.glob("**/*")
-    if f.is_file()
+    (path, path[_prefix_len:]) for path in _walk_files(str(_application_path))
 ]
 
 docsassist_path = PROJECT_ROOT / "docsassist"
@@ -56,23 +78,13 @@ source_files.extend(
 application_locale = LocaleSettings().app_locale
 
 if application_locale != LanguageCode.EN:
-    source_files.append(
-        (
-            str(
-                docsassist_path
-                / "locale"
-                / application_locale
-                / "LC_MESSAGES"
-                / "base.mo"
-            ),
-            f"docsassist/locale/{application_locale}/LC_MESSAGES/base.mo",
-        )
-    )
+    locale_mo_rel = f"docsassist/locale/{application_locale}/LC_MESSAGES/base.mo"
+    source_files.append((os.path.join(str(PROJECT_ROOT), locale_mo_rel), locale_mo_rel))
 
 app_source_args = ApplicationSourceArgs(
-    resource_name=f"Guarded RAG App Source [{project_name}]",
+    resource_name="Guarded RAG App Source" + project_name_suffix,
     base_environment_id=GlobalRuntimeEnvironment.PYTHON_39_STREAMLIT.value.id,
     files=source_files,
 ).model_dump(mode="json", exclude_none=True)
 
-app_resource_name: str = f"Guarded RAG Application [{project_name}]"
+app_resource_name: str = "Guarded RAG Application" + project_name_suffix
@@ -43,14 +43,14 @@ from .settings_main import (
     PROJECT_ROOT,
     core,
     default_prediction_server_id,
-    project_name,
+    project_name_suffix,
 )
 
 LLM = GlobalLLM.AZURE_OPENAI_GPT_4_O_MINI
 
 
 custom_model_args = CustomModelArgs(
-    resource_name=f"Guarded RAG Custom Model [{project_name}]",
+    resource_name="Guarded RAG Custom Model" + project_name_suffix,
     name="Guarded RAG Assistant",  # built-in QA app uses this as the AI's name
     target_name=TARGET_COLUMN_NAME,
     target_type=dr.enums.TARGET_TYPE.TEXT_GENERATION,
@@ -58,13 +58,13 @@ custom_model_args = CustomModelArgs(
 )
 
 registered_model_args = RegisteredModelArgs(
-    resource_name=f"Guarded RAG Registered Model [{project_name}]",
+    resource_name="Guarded RAG Registered Model" + project_name_suffix,
 )
 
 
 deployment_args = DeploymentArgs(
-    resource_name=f"Guarded RAG Deployment [{project_name}]",
-    label=f"Guarded RAG Deployment [{project_name}]",
+    resource_name="Guarded RAG Deployment" + project_name_suffix,
+    label="Guarded RAG Deployment" + project_name_suffix,
     association_id_settings=datarobot.DeploymentAssociationIdSettingsArgs(
         column_names=["association_id"],
         auto_generate_id=False,
@@ -83,16 +83,16 @@ deployment_args = DeploymentArgs(
 if core.rag_type == RAGType.DR:
     # if providing DIY RAG logic, these settings are N/A
     playground_args = PlaygroundArgs(
-        resource_name=f"Guarded RAG Playground [{project_name}]",
+        resource_name="Guarded RAG Playground" + project_name_suffix,
     )
 
     dataset_args = DatasetArgs(
-        resource_name=f"Guarded RAG Documents Dataset [{project_name}]",
+        resource_name="Guarded RAG Documents Dataset" + project_name_suffix,
         file_path=core.rag_documents,
     )
 
     vector_database_args = VectorDatabaseArgs(
-        resource_name=f"Guarded RAG Vector DB [{project_name}]",
+        resource_name="Guarded RAG Vector DB" + project_name_suffix,
         chunking_parameters=ChunkingParameters(
             embedding_model=dr.enums.VectorDatabaseEmbeddingModel.JINA_EMBEDDING_T_EN_V1,
             chunk_size=512,
@@ -109,7 +109,7 @@ if core.rag_type == RAGType.DR:
                 """
 
     llm_blueprint_args = LLMBlueprintArgs(
-        resource_name=f"Guarded RAG LLM Blueprint [{project_name}]",
+        resource_name="Guarded RAG LLM Blueprint" + project_name_suffix,
         llm_id=LLM.name,
         llm_settings=LLMSettings(
             max_completion_length=512,
@@ -31,6 +31,9 @@ from .common.stack import get_stack
 
 project_name = get_stack()
 
+# Interpolated into every resource label; computed once instead of per f-string
+project_name_suffix = f" [{project_name}]"
+
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.absolute()
 
 # Core settings are overridable by environment variables; env values take precedence
@@ -45,11 +48,11 @@ runtime_environment_moderations = GlobalRuntimeEnvironment.PYTHON_311_MODERATION
 default_prediction_server_id: Optional[str] = None
 
 prediction_environment_args = PredictionEnvironmentArgs(
-    resource_name=f"Guarded RAG Prediction Environment [{project_name}]",
+    resource_name="Guarded RAG Prediction Environment" + project_name_suffix,
     platform=GlobalPredictionEnvironmentPlatforms.DATAROBOT_SERVERLESS,
 ).model_dump(mode="json", exclude_none=True)
 
 use_case_args = UseCaseArgs(
-    resource_name=f"Guarded RAG Use Case [{project_name}]",
+    resource_name="Guarded RAG Use Case" + project_name_suffix,
     description="Use case for Guarded RAG Assistant application",
 ).model_dump(exclude_none=True)
@@ -26,7 +26,7 @@ from .common.schema import (
 )
 from .settings_main import (
     default_prediction_server_id,
-    project_name,
+    project_name_suffix,
     runtime_environment_moderations,
 )
 
@@ -34,7 +34,7 @@ from .settings_main import (
 TEXTGEN_DEPLOYMENT_PROMPT_COLUMN_NAME = None
 
 custom_model_args = CustomModelArgs(
-    resource_name=f"Guarded RAG Proxy LLM Custom Model [{project_name}]",
+    resource_name="Guarded RAG Proxy LLM Custom Model" + project_name_suffix,
     base_environment_id=runtime_environment_moderations.id,
     target_name=TARGET_COLUMN_NAME,
     target_type=dr.enums.TARGET_TYPE.TEXT_GENERATION,
@@ -42,13 +42,13 @@ custom_model_args = CustomModelArgs(
 )
 
 registered_model_args = RegisteredModelArgs(
-    resource_name=f"Guarded RAG Proxy LLM Registered Model [{project_name}]",
+    resource_name="Guarded RAG Proxy LLM Registered Model" + project_name_suffix,
 )
 
 
 deployment_args = DeploymentArgs(
-    resource_name=f"Guarded RAG Proxy LLM Deployment [{project_name}]",
-    label=f"Guarded RAG Proxy LLM Deployment [{project_name}]",
+    resource_name="Guarded RAG Proxy LLM Deployment" + project_name_suffix,
+    label="Guarded RAG Proxy LLM Deployment" + project_name_suffix,
     association_id_settings=datarobot.DeploymentAssociationIdSettingsArgs(
         column_names=["association_id"],
         auto_generate_id=False,
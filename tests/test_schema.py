@@ -0,0 +1,68 @@
+# Copyright 2024 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import subprocess
+import sys
+
+import pandas as pd
+
+from docsassist.schema import RAGOutput
+
+
+def test_schema_import_has_no_heavy_dependencies():
+    """docsassist.schema must stay importable without infra or pandas."""
+    script = (
+        "import sys; import docsassist.schema; "
+        "heavy = {'pulumi', 'pulumi_datarobot', 'datarobot', 'pandas'}; "
+        "loaded = heavy & {m.split('.')[0] for m in sys.modules}; "
+        "assert not loaded, loaded"
+    )
+    subprocess.check_call([sys.executable, "-c", script])
+
+
+def _prediction_row() -> dict:
+    return {
+        "resultText": "An answer",
+        "CITATION_CONTENT_0": "first chunk",
+        "CITATION_SOURCE_0": "doc1.pdf",
+        "CITATION_PAGE_0": "2",
+        "CITATION_CONTENT_1": "second chunk",
+        "CITATION_SOURCE_1": "doc2.pdf",
+        "CITATION_PAGE_1": float("nan"),
+    }
+
+
+def test_parse_references_assembles_citations():
+    rag_output = RAGOutput.model_validate(_prediction_row())
+
+    assert rag_output.completion == "An answer"
+    assert [ref.page_content for ref in rag_output.references] == [
+        "first chunk",
+        "second chunk",
+    ]
+    assert rag_output.references[0].metadata.source == "doc1.pdf"
+    assert rag_output.references[0].metadata.page == 2
+    assert rag_output.references[1].metadata.page is None
+
+
+def test_from_dataframe_matches_validated_path():
+    row = _prediction_row()
+    expected = RAGOutput.model_validate(dict(row))
+
+    (rag_output,) = RAGOutput.from_dataframe(pd.DataFrame([row]))
+
+    assert rag_output.model_dump() == expected.model_dump()
+    # json comparison catches type drift (e.g. a float page) that numeric
+    # equality in model_dump() would mask
+    assert rag_output.model_dump_json() == expected.model_dump_json()